@@ -38,6 +38,7 @@
 LOAD_GLOBAL = opmap['LOAD_GLOBAL']
 BINARY_OP = opmap['BINARY_OP']
 JUMP_BACKWARD = opmap['JUMP_BACKWARD']
+JUMP_BACKWARD_NO_INTERRUPT = opmap['JUMP_BACKWARD_NO_INTERRUPT']
 FOR_ITER = opmap['FOR_ITER']
 SEND = opmap['SEND']
 LOAD_ATTR = opmap['LOAD_ATTR']
@@ -56,6 +57,30 @@
     specialized: base for base, family in _specializations.items() for specialized in family
 }
 
+# Indexed by opcode: the base opcode of each specialized instruction,
+# and the opcode itself for everything else.
+_deoptops = [
+    _all_opmap[deoptmap[name]] if name in deoptmap else op
+    for op, name in enumerate(_all_opname)
+]
+
+# The opcode module exposes these as lists; membership tests in the
+# decoding loops below are much cheaper against sets.
+_hasarg = frozenset(hasarg)
+_hasconst = frozenset(hasconst)
+_hasname = frozenset(hasname)
+_hasjrel = frozenset(hasjrel)
+_hasjabs = frozenset(hasjabs)
+_haslocal = frozenset(haslocal)
+_hasfree = frozenset(hasfree)
+_hascompare = frozenset(hascompare)
+
+# Opcodes (including specialized forms) whose argument is a jump target,
+# and the bytes of every other opcode for findlabels()'s prescan.
+_jump_opcodes = frozenset(op for op, deop in enumerate(_deoptops[:256])
+                          if deop in _hasjrel or deop in _hasjabs)
+_non_jump_opcodes = bytes(op for op in range(256) if op not in _jump_opcodes)
+
 def _try_compile(source, name):
     """Attempts to compile the given source, first as an expression and
        then as a statement if the first approach fails.
@@ -81,18 +106,7 @@ def dis(x=None, *, file=None, depth=None, show_caches=False, adaptive=False):
     if x is None:
         distb(file=file, show_caches=show_caches, adaptive=adaptive)
         return
-    # Extract functions from methods.
-    if hasattr(x, '__func__'):
-        x = x.__func__
-    # Extract compiled code objects from...
-    if hasattr(x, '__code__'):  # ...a function, or
-        x = x.__code__
-    elif hasattr(x, 'gi_code'):  #...a generator object, or
-        x = x.gi_code
-    elif hasattr(x, 'ag_code'):  #...an asynchronous generator object, or
-        x = x.ag_code
-    elif hasattr(x, 'cr_code'):  #...a coroutine.
-        x = x.cr_code
+    x = _unwrap_code(x)
     # Perform the disassembly.
     if hasattr(x, '__dict__'):  # Class or module
         items = sorted(x.__dict__.items())
@@ -164,8 +178,10 @@ def __repr__(self):
 # Sentinel to represent values that cannot be calculated
 UNKNOWN = _Unknown()
 
-def _get_code_object(x):
-    """Helper to handle methods, compiled or raw code objects, and strings."""
+def _unwrap_code(x):
+    """Helper to get the code object from functions, methods, generators
+       and coroutines.  Anything else is returned unchanged.
+    """
     # Extract functions from methods.
     if hasattr(x, '__func__'):
         x = x.__func__
@@ -178,6 +194,11 @@ def _get_code_object(x):
         x = x.ag_code
     elif hasattr(x, 'cr_code'):  #...a coroutine.
         x = x.cr_code
+    return x
+
+def _get_code_object(x):
+    """Helper to handle methods, compiled or raw code objects, and strings."""
+    x = _unwrap_code(x)
     # Handle source code.
     if isinstance(x, str):
         x = _try_compile(x, "<disassembly>")
@@ -187,10 +208,6 @@ def _get_code_object(x):
     raise TypeError("don't know how to disassemble %s objects" %
                     type(x).__name__)
 
-def _deoptop(op):
-    name = _all_opname[op]
-    return _all_opmap[deoptmap[name]] if name in deoptmap else op
-
 def _get_code_array(co, adaptive):
     return co._co_code_adaptive if adaptive else co.co_code
 
@@ -296,6 +313,8 @@ class Instruction(_Instruction):
                      covered by this instruction
     """
 
+    __slots__ = ()
+
     def _disassemble(self, lineno_width=3, mark_as_current=False, offset_width=4):
         """Format instruction details for inclusion in disassembly output
 
@@ -365,7 +384,7 @@ def _get_const_value(op, arg, co_consts):
        Otherwise (if it is a LOAD_CONST and co_consts is not
        provided) returns the dis.UNKNOWN sentinel.
     """
-    assert op in hasconst
+    assert op in _hasconst
 
     argval = UNKNOWN
     if op == LOAD_CONST or op == RETURN_CONST:
@@ -385,7 +404,7 @@ def _get_const_info(op, arg, co_consts):
     argrepr = repr(argval) if argval is not UNKNOWN else ''
     return argval, argrepr
 
-def _get_name_info(name_index, get_name, **extrainfo):
+def _get_name_info(name_index, get_name):
     """Helper to get optional details about named references
 
        Returns the dereferenced name as both value and repr if the name
@@ -394,7 +413,7 @@ def _get_name_info(name_index, get_name, **extrainfo):
        and an empty string for its repr.
     """
     if get_name is not None:
-        argval = get_name(name_index, **extrainfo)
+        argval = get_name(name_index)
         return argval, argval
     else:
         return UNKNOWN, ''
@@ -425,7 +444,25 @@ def _parse_exception_table(code):
         return entries
 
 def _is_backward_jump(op):
-    return 'JUMP_BACKWARD' in opname[op]
+    return op == JUMP_BACKWARD or op == JUMP_BACKWARD_NO_INTERRUPT
+
+def _get_jump_target(op, arg, offset):
+    """Gets the bytecode offset of the jump target if this is a jump instruction.
+
+    Otherwise return None.
+    """
+    deop = _deoptops[op]
+    caches = _inline_cache_entries[deop]
+    if deop in _hasjrel:
+        if _is_backward_jump(deop):
+            arg = -arg
+        target = offset + 2 + arg*2
+        target += 2 * caches
+    elif deop in _hasjabs:
+        target = arg*2
+    else:
+        target = None
+    return target
 
 def _get_instructions_bytes(code, varname_from_oparg=None,
                             names=None, co_consts=None,
@@ -442,12 +479,18 @@ def _get_instructions_bytes(code, varname_from_oparg=None,
     """
     co_positions = co_positions or iter(())
     get_name = None if names is None else names.__getitem__
-    labels = set(findlabels(code))
+    # Decode once and find the jump targets from the decoded instructions;
+    # they must all be known before the main loop reaches them.
+    opargs = list(_unpack_opargs(code))
+    labels = set(_find_jump_targets(opargs))
     for start, end, target, _, _ in exception_entries:
-        for i in range(start, end):
+        if start < end:
             labels.add(target)
     starts_line = None
-    for offset, op, arg in _unpack_opargs(code):
+    # Consecutive instructions often cover the same source span; share
+    # one Positions object between them rather than building a new one.
+    last_position = None
+    for offset, op, arg in opargs:
         if linestarts is not None:
             starts_line = linestarts.get(offset, None)
             if starts_line is not None:
@@ -455,18 +498,20 @@ def _get_instructions_bytes(code, varname_from_oparg=None,
         is_jump_target = offset in labels
         argval = None
         argrepr = ''
-        positions = Positions(*next(co_positions, ()))
-        deop = _deoptop(op)
-        caches = _inline_cache_entries[deop]
+        position = next(co_positions, ())
+        if position != last_position:
+            positions = Positions(*position)
+            last_position = position
+        deop = _deoptops[op]
         if arg is not None:
             #  Set argval to the dereferenced value of the argument when
             #  available, and argrepr to the string representation of argval.
             #    _disassemble_bytes needs the string repr of the
             #    raw name index for LOAD_GLOBAL, LOAD_CONST, etc.
             argval = arg
-            if deop in hasconst:
+            if deop in _hasconst:
                 argval, argrepr = _get_const_info(deop, arg, co_consts)
-            elif deop in hasname:
+            elif deop in _hasname:
                 if deop == LOAD_GLOBAL:
                     argval, argrepr = _get_name_info(arg//2, get_name)
                     if (arg & 1) and argrepr:
@@ -477,17 +522,12 @@ def _get_instructions_bytes(code, varname_from_oparg=None,
                         argrepr = "NULL|self + " + argrepr
                 else:
                     argval, argrepr = _get_name_info(arg, get_name)
-            elif deop in hasjabs:
-                argval = arg*2
-                argrepr = "to " + repr(argval)
-            elif deop in hasjrel:
-                signed_arg = -arg if _is_backward_jump(deop) else arg
-                argval = offset + 2 + signed_arg*2
-                argval += 2 * caches
+            elif deop in _hasjabs or deop in _hasjrel:
+                argval = _get_jump_target(deop, arg, offset)
                 argrepr = "to " + repr(argval)
-            elif deop in haslocal or deop in hasfree:
+            elif deop in _haslocal or deop in _hasfree:
                 argval, argrepr = _get_name_info(arg, varname_from_oparg)
-            elif deop in hascompare:
+            elif deop in _hascompare:
                 argval = cmp_op[arg>>4]
                 argrepr = argval
             elif deop == FORMAT_VALUE:
@@ -612,9 +652,9 @@ def _unpack_opargs(code):
             caches -= 1
             continue
         op = code[i]
-        deop = _deoptop(op)
+        deop = _deoptops[op]
         caches = _inline_cache_entries[deop]
-        if deop in hasarg:
+        if deop in _hasarg:
             arg = code[i+1] | extended_arg
             extended_arg = (arg << 8) if deop == EXTENDED_ARG else 0
             # The oparg is stored as a signed integer
@@ -633,21 +673,23 @@ def findlabels(code):
     Return the list of offsets.
 
     """
+    # Many code objects contain no jumps at all.  Deleting every non-jump
+    # opcode from the opcode bytes is done in C, and an empty result means
+    # there is nothing to decode.  Inline cache data may produce a false
+    # positive here, but never a false negative.
+    if not bytes(code[::2]).translate(None, _non_jump_opcodes):
+        return []
+    return _find_jump_targets(_unpack_opargs(code))
+
+def _find_jump_targets(opargs):
+    """Collect the jump targets of (offset, op, arg) triples in order."""
     labels = []
-    for offset, op, arg in _unpack_opargs(code):
-        if arg is not None:
-            deop = _deoptop(op)
-            caches = _inline_cache_entries[deop]
-            if deop in hasjrel:
-                if _is_backward_jump(deop):
-                    arg = -arg
-                label = offset + 2 + arg*2
-                label += 2 * caches
-            elif deop in hasjabs:
-                label = arg*2
-            else:
-                continue
-            if label not in labels:
+    seen = set()
+    for offset, op, arg in opargs:
+        if op in _jump_opcodes:
+            label = _get_jump_target(op, arg, offset)
+            if label not in seen:
+                seen.add(label)
                 labels.append(label)
     return labels
 
@@ -674,16 +716,19 @@ def _find_imports(co):
 
     consts = co.co_consts
     names = co.co_names
-    opargs = [(op, arg) for _, op, arg in _unpack_opargs(co.co_code)
-                  if op != EXTENDED_ARG]
-    for i, (op, oparg) in enumerate(opargs):
-        if op == IMPORT_NAME and i >= 2:
-            from_op = opargs[i-1]
-            level_op = opargs[i-2]
-            if (from_op[0] in hasconst and level_op[0] in hasconst):
+    # IMPORT_NAME only needs to look back at the two instructions before
+    # it, so remember those while walking forward instead of building a
+    # list of every instruction first.
+    level_op = from_op = None
+    for _, op, oparg in _unpack_opargs(co.co_code):
+        if op == EXTENDED_ARG:
+            continue
+        if op == IMPORT_NAME and level_op is not None:
+            if (from_op[0] in _hasconst and level_op[0] in _hasconst):
                 level = _get_const_value(level_op[0], level_op[1], consts)
                 fromlist = _get_const_value(from_op[0], from_op[1], consts)
                 yield (names[oparg], level, fromlist)
+        level_op, from_op = from_op, (op, oparg)
 
 def _find_store_names(co):
     """Find names of variables which are written in the code
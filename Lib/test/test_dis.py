@@ -1901,6 +1901,35 @@ def test_findlabels(self):
 
         self.assertEqual(sorted(labels), sorted(jumps))
 
+    def test_findlabels_no_jumps(self):
+        def f(a, b):
+            return a + b
+        self.assertEqual(dis.findlabels(f.__code__.co_code), [])
+        self.assertEqual(dis.findlabels(b''), [])
+
+    @cpython_only
+    @requires_specialization
+    def test_findlabels_specialized(self):
+        loop_test()
+        co = loop_test.__code__
+        self.assertIn("FOR_ITER_LIST",
+                      [instr.opname for instr in
+                       dis.get_instructions(co, adaptive=True)])
+        self.assertEqual(dis.findlabels(co._co_code_adaptive),
+                         dis.findlabels(co.co_code))
+        self.assertNotEqual(dis.findlabels(co.co_code), [])
+
+    def test_findlabels_jump_opcode_in_cache(self):
+        # The only jump opcode byte is inline cache data, which must not
+        # be decoded as an instruction.
+        binary_op = dis.opmap['BINARY_OP']
+        self.assertEqual(dis._inline_cache_entries[binary_op], 1)
+        code = bytes([binary_op, 0,
+                      dis.opmap['JUMP_FORWARD'], 0,
+                      dis.opmap['RETURN_VALUE'], 0])
+        self.assertTrue(code[::2].translate(None, dis._non_jump_opcodes))
+        self.assertEqual(dis.findlabels(code), [])
+
 
 class TestDisTraceback(DisTestBase):
     def setUp(self) -> None: